@@ -1,14 +1,18 @@
 """.. include:: ../../README.md"""  # noqa: D415
 
-from mobi_physio_api.device import PluxDevice
-from mobi_physio_api.sensor_detection import (
-    SENSOR_TYPE_MAPPING,
-    detect_sensor_type,
-    generate_channel_names,
-    get_channel_mapping,
-    get_sensor_info,
-)
-from mobi_physio_api.streaming import LSLStreamer
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from mobi_physio_api.device import PluxDevice
+    from mobi_physio_api.sensor_detection import (
+        SENSOR_TYPE_MAPPING,
+        detect_sensor_type,
+        generate_channel_names,
+        get_channel_mapping,
+        get_sensor_info,
+    )
+    from mobi_physio_api.streaming import LSLStreamer
 
 __version__ = "0.1.0"
 __author__ = "Child Mind Institute"
@@ -23,3 +27,36 @@ __all__ = [
     "get_channel_mapping",
     "LSLStreamer",
 ]
+
+# Deferred imports keep `import mobi_physio_api` cheap: the heavy
+# submodules (device pulls in pylsl and numpy) only load on first access.
+_LAZY_EXPORTS = {
+    "PluxDevice": "mobi_physio_api.device",
+    "SENSOR_TYPE_MAPPING": "mobi_physio_api.sensor_detection",
+    "detect_sensor_type": "mobi_physio_api.sensor_detection",
+    "get_sensor_info": "mobi_physio_api.sensor_detection",
+    "generate_channel_names": "mobi_physio_api.sensor_detection",
+    "get_channel_mapping": "mobi_physio_api.sensor_detection",
+    "LSLStreamer": "mobi_physio_api.streaming",
+}
+
+
+def __getattr__(name: str) -> object:
+    """Resolve exported names lazily on first attribute access (PEP 562).
+
+    Args:
+        name: Attribute being looked up on the package.
+
+    Returns:
+        The resolved symbol from its defining submodule.
+
+    Raises:
+        AttributeError: If the name is not part of the public API.
+    """
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    value: object = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value  # Cache so subsequent lookups skip __getattr__
+    return value
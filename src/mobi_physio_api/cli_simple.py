@@ -4,12 +4,10 @@ from __future__ import annotations
 
 import argparse
 import logging
+import re
 import sys
 from pathlib import Path
 
-from mobi_physio_api.device import PluxDevice
-from mobi_physio_api.utils import setup_signal_handler
-
 # Set up logging
 logging.basicConfig(
     level=logging.INFO,
@@ -19,6 +17,54 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+# Compiled once: matches one "port:TYPE" pair in the --sensors argument
+_SENSOR_RE = re.compile(r"\s*(\d+)\s*:\s*([A-Za-z0-9_]+)\s*")
+
+# MAC address as XX:XX:XX:XX:XX:XX, with an optional Windows BTH prefix
+_MAC_RE = re.compile(r"(?:BTH)?[0-9A-Fa-f]{2}(?::[0-9A-Fa-f]{2}){5}")
+
+
+def _mac_address(value: str) -> str:
+    """Validate a MAC address argument at parse time.
+
+    Args:
+        value: Raw --mac argument string.
+
+    Returns:
+        The validated MAC address string.
+
+    Raises:
+        argparse.ArgumentTypeError: If the value is not a MAC address.
+    """
+    if not _MAC_RE.fullmatch(value):
+        msg = f"invalid MAC address: {value!r} (expected XX:XX:XX:XX:XX:XX)"
+        raise argparse.ArgumentTypeError(msg)
+    return value
+
+
+def _sensor_map(value: str) -> dict[int, str]:
+    """Parse the --sensors argument into a port-to-type mapping.
+
+    Args:
+        value: Raw --sensors argument, e.g. "1:EMG,2:RSP,3:EDA".
+
+    Returns:
+        Mapping of port numbers to upper-cased sensor type strings.
+
+    Raises:
+        argparse.ArgumentTypeError: If the value is not port:type pairs.
+    """
+    mapping: dict[int, str] = {}
+    for token in value.split(","):
+        # Anchor every token: a missing comma or trailing junk must reject
+        # the whole argument, not silently record under a misparsed type
+        match = _SENSOR_RE.fullmatch(token)
+        if match is None:
+            msg = f"invalid sensor mapping: {value!r} (expected 1:EMG,2:RSP,3:EDA)"
+            raise argparse.ArgumentTypeError(msg)
+        mapping[int(match.group(1))] = match.group(2).upper()
+    return mapping
+
 
 def main() -> int:
     """Main entry point for PLUX device streaming CLI.
@@ -34,6 +80,7 @@ def main() -> int:
     parser.add_argument(
         "--mac",
         required=True,
+        type=_mac_address,
         help="Device MAC address (e.g., 00:07:80:8C:08:DF)",
     )
     parser.add_argument(
@@ -54,6 +101,7 @@ def main() -> int:
     )
     parser.add_argument(
         "--sensors",
+        type=_sensor_map,
         help=(
             "Manual sensor mapping as port:type pairs. "
             "Example: --sensors 1:EMG,2:RSP,3:EDA,5:ECG,9:SpO2"
@@ -62,19 +110,15 @@ def main() -> int:
 
     args = parser.parse_args()
 
-    # Parse manual sensor mapping if provided
-    manual_sensor_map = {}
-    if args.sensors:
-        try:
-            for mapping in args.sensors.split(","):
-                port_str, sensor_type = mapping.strip().split(":")
-                port = int(port_str)
-                manual_sensor_map[port] = sensor_type.upper()
-            logger.info("Manual sensor mapping: %s", manual_sensor_map)
-        except ValueError as e:
-            logger.error("Invalid sensor mapping format: %s", e)
-            logger.error("Expected format: --sensors 1:EMG,2:RSP,3:EDA")
-            return 1
+    # Imported after argument parsing so --help and usage errors don't pay
+    # for pylsl/numpy (and transitively the PLUX SDK) import time
+    from mobi_physio_api.device import PluxDevice
+    from mobi_physio_api.utils import cleanup_plux_processes, setup_signal_handler
+
+    # Mapping is parsed and validated by argparse via _sensor_map
+    manual_sensor_map = args.sensors or {}
+    if manual_sensor_map:
+        logger.info("Manual sensor mapping: %s", manual_sensor_map)
 
     try:
         logger.info("Initializing PLUX device...")
@@ -110,6 +154,10 @@ def main() -> int:
         logger.error("Error: %s", e)
         logger.error("Error type: %s", type(e).__name__)
         return 1
+    finally:
+        # Process-level cleanup runs here in normal context, not inside the
+        # signal handler, so interrupts stay cheap and async-signal-safe
+        cleanup_plux_processes()
 
     return 0
 
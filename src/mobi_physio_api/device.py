@@ -3,11 +3,15 @@
 from __future__ import annotations
 
 import logging
+import sys
+import threading
 import time
 from pathlib import Path
 from typing import Any
 
-from pylsl import StreamInfo, StreamOutlet
+import numpy as np
+from numpy.typing import NDArray
+from pylsl import StreamInfo, StreamOutlet, local_clock
 
 from mobi_physio_api.platform_detection import setup_plux_import_path
 from mobi_physio_api.sensor_detection import get_sensor_info
@@ -15,6 +19,55 @@ from mobi_physio_api.utils import format_mac_address, is_emergency_shutdown
 
 logger = logging.getLogger(__name__)
 
+# Target wall-clock span of one LSL chunk, in seconds. Batching amortizes the
+# Python-to-C crossing in pylsl instead of paying it per sample; the batch
+# size is derived from the sampling rate so added latency stays near 20 ms
+# regardless of the configured rate.
+BATCH_WINDOW_S = 0.02
+
+# Capacity of the single-producer/single-consumer ring between the SDK
+# callback and the LSL sender thread. A power of two makes slot indexing a
+# mask instead of a modulo; 1024 frames is ~1 s of headroom at the default
+# rate, so transient LSL stalls never block acquisition.
+_RING_SLOTS = 1024
+_RING_MASK = _RING_SLOTS - 1
+
+# Connection retry schedule: early retries are cheap so transient Bluetooth
+# failures recover quickly, while the exponential backoff cap keeps late
+# retries from thrashing the stack.
+_CONNECT_ATTEMPTS = 4
+_INITIAL_RETRY_INTERVAL = 0.25
+_MAX_RETRY_INTERVAL = 2.0
+
+# Default SDK base directory, resolved lazily once per process. The working
+# directory does not change between PluxDevice instantiations, so repeated
+# constructions skip the getcwd syscall and Path construction.
+_DEFAULT_SDK_BASE: Path | None = None
+
+# Built once at import; the error path emits them as a single log record
+# instead of one handler call per line.
+_CONNECT_TROUBLESHOOTING = (
+    "Make sure the device is turned on and in pairing mode",
+    "You may need to pair the device in Bluetooth settings first",
+)
+
+
+class _LazyFmt:
+    """Defer sample formatting until a log record is actually emitted.
+
+    Passed as a lazy ``%r`` argument so the per-value float formatting only
+    runs when a handler accepts the record, not when the logging call is
+    made on the acquisition thread.
+    """
+
+    __slots__ = ("values",)
+
+    def __init__(self, values: NDArray[np.float32]) -> None:
+        self.values = values
+
+    def __repr__(self) -> str:
+        return "[" + ", ".join(f"{val:.2f}" for val in self.values) + "]"
+
 
 class PluxDevice:
     """PLUX biosignals device interface for data streaming.
@@ -47,7 +100,10 @@ class PluxDevice:
 
         # Set up PLUX SDK
         if plux_sdk_path is None:
-            plux_sdk_path = Path.cwd()
+            global _DEFAULT_SDK_BASE
+            if _DEFAULT_SDK_BASE is None:
+                _DEFAULT_SDK_BASE = Path.cwd()
+            plux_sdk_path = _DEFAULT_SDK_BASE
 
         self.plux_path = setup_plux_import_path(plux_sdk_path)
 
@@ -64,23 +120,93 @@ class PluxDevice:
         self.device: Any | None = None
         self.channels: list[int] = []
         self.sensor_types: dict[int, str] = {}
+        self._spo2_ports: frozenset[int] = frozenset()
+        self._sensor_type_values: tuple[str, ...] = ()
         self.running = False
 
+        # Set by the callback once it has observed the stop request, so
+        # stop_streaming can wait exactly as long as needed instead of a
+        # fixed grace sleep.
+        self._callback_done = threading.Event()
+
         # LSL stream
         self.outlet: StreamOutlet | None = None
-        self.sample_count = 0
-        self.last_print_time = time.time()
+
+        # Target LSL chunk size, kept near BATCH_WINDOW_S at the configured
+        # rate; used for the outlet's wire chunking and the sender's pacing.
+        self._batch_size = max(1, round(sampling_rate * BATCH_WINDOW_S))
+
+        # SPSC ring between the SDK callback (producer) and the LSL sender
+        # thread (consumer). Each side writes only its own index, and the
+        # GIL makes those single int stores atomic, so no lock is needed;
+        # the callback stays wait-free even when pylsl stalls.
+        self._ring: NDArray[np.float32] | None = None
+        self._ring_head = 0
+        self._ring_tail = 0
+        self._ring_dropped = 0
+        self._sender: threading.Thread | None = None
+
+        # Index table mapping each output channel to its slot in the raw
+        # frame, precomputed so the callback needs no per-frame dispatch.
+        self._gather_idx: NDArray[np.intp] | None = None
+
+        # Reusable scratch array for the incoming raw frame, so conversion
+        # from the PLUX list is a single C-level fill with no allocation.
+        self._frame: NDArray[np.float32] | None = None
+        self._raw_width = 0
+
+        # Channel labels, interned and frozen once the layout is known.
+        self._channel_names: tuple[str, ...] = ()
+
+        # Configured plux.Source objects, built in _detect_sensors; the
+        # module-level source pool keeps their identities across reconnects.
+        self._sources: list[Any] = []
+
+        # Acquisition start time (LSL clock) and total pushed samples, from
+        # which chunk timestamps are derived without per-flush clock reads.
+        self._t0 = 0.0
+        self._pushed = 0
 
         # Signal handler will be set up externally
         self.running = False
 
     def connect_and_setup(self) -> None:
         """Connect to device and configure sensors for streaming."""
+        if self.device is not None:
+            # Already connected; repeated calls are a cheap no-op instead of
+            # re-entering the retry loop
+            logger.debug("Device already connected, skipping setup")
+            return
+
         logger.info("Connecting to device %s...", self.mac_address)
 
         try:
-            # Create device instance using the working pattern
-            self.device = self._create_working_device()
+            # Create device instance using the working pattern, retrying with
+            # exponential backoff on transient Bluetooth failures
+            retry_interval = _INITIAL_RETRY_INTERVAL
+            for attempt in range(1, _CONNECT_ATTEMPTS + 1):
+                # The SIGINT handler only sets flags (async-signal-safe) and
+                # PEP 475 restarts interrupted sleeps, so honor a shutdown
+                # request here instead of grinding through remaining attempts
+                if is_emergency_shutdown():
+                    raise KeyboardInterrupt
+                try:
+                    self.device = self._create_working_device()
+                    break
+                except Exception as e:
+                    if attempt == _CONNECT_ATTEMPTS:
+                        raise
+                    logger.warning(
+                        "Connection attempt %d/%d failed: %s (retrying in %.2fs)",
+                        attempt,
+                        _CONNECT_ATTEMPTS,
+                        e,
+                        retry_interval,
+                    )
+                    if is_emergency_shutdown():
+                        raise KeyboardInterrupt from e
+                    time.sleep(retry_interval)
+                    retry_interval = min(retry_interval * 2, _MAX_RETRY_INTERVAL)
             logger.info("Device connection established")
 
             # Wait a moment for connection to stabilize
@@ -97,9 +223,11 @@ class PluxDevice:
             logger.info("Device setup complete")
 
         except Exception as e:
-            logger.error("Failed to connect to device: %s", e)
-            logger.error("Make sure the device is turned on and in pairing mode")
-            logger.error("You may need to pair the device in Bluetooth settings first")
+            logger.error(
+                "Failed to connect to device: %s\n%s",
+                e,
+                "\n".join(_CONNECT_TROUBLESHOOTING),
+            )
             raise
 
     def _create_working_device(self) -> Any:  # noqa: ANN401
@@ -116,7 +244,7 @@ class PluxDevice:
                 device_self.mac = mac
                 device_self.parent_plux = self
                 device_self.sample_count = 0
-                device_self.last_print = time.time()
+                device_self.last_print = time.monotonic()
 
             def onRawFrame(device_self, seq: int, data: list[float]) -> bool:
                 """Handle incoming data frames from PLUX device.
@@ -129,27 +257,63 @@ class PluxDevice:
                     True to stop acquisition, False to continue.
                 """
                 if not self.running or is_emergency_shutdown():
+                    self._callback_done.set()
                     return True  # Stop
 
-                # Push data to LSL
-                if self.outlet:
-                    self.outlet.push_sample(data[: len(self.channels)])
+                # Write into the ring buffer; the sender thread drains it.
+                # Bind the hot attributes to locals once per frame so the
+                # rest of the callback runs on fast local loads.
+                ring = self._ring
+                gather_idx = self._gather_idx
+                frame = self._frame
+                if (
+                    self.outlet
+                    and ring is not None
+                    and gather_idx is not None
+                    and frame is not None
+                ):
+                    head = self._ring_head
+                    if head - self._ring_tail >= _RING_SLOTS:
+                        # Ring full (LSL side stalled): drop the incoming
+                        # frame rather than block the acquisition thread
+                        self._ring_dropped += 1
+                        return False
+                    # Fill the persistent scratch array in place, then gather
+                    # raw values into the output layout in one C call
+                    width = self._raw_width
+                    if len(data) == width:
+                        frame[:] = data
+                    else:
+                        frame[:] = data[:width]
+                    row = ring[head & _RING_MASK]
+                    np.take(frame, gather_idx, out=row)
+                    # Publish only after the row is fully written
+                    self._ring_head = head + 1
                     device_self.sample_count += 1
 
-                    # Progress info and sample data every 1000 samples
-                    if device_self.sample_count % 1000 == 0:
-                        elapsed = time.time() - device_self.last_print
-                        rate = 1000 / elapsed if elapsed > 0 else 0
+                    # Progress info every 1024 samples; the bitmask test is a
+                    # single AND, and the clock read plus sample formatting
+                    # only happen when a handler will actually emit the record
+                    count = device_self.sample_count
+                    if count & 1023 == 0 and logger.isEnabledFor(logging.INFO):
+                        # Measure the true rate only every eighth tick; the
+                        # nominal rate stands in between reads, amortizing
+                        # the clock call 8x while still catching drift
+                        if count & 8191 == 0:
+                            now = time.monotonic()
+                            elapsed = now - device_self.last_print
+                            rate = 8192 / elapsed if elapsed > 0 else 0.0
+                            device_self.last_print = now
+                        else:
+                            rate = self.sampling_rate
 
                         # Show actual sample data
-                        sample_data = data[: len(self.channels)]
                         logger.info(
-                            "Streaming: %d samples, %.1f Hz - Sample data: %s",
-                            device_self.sample_count,
+                            "Streaming: %d samples, %.1f Hz - Sample data: %r",
+                            count,
                             rate,
-                            [f"{val:.2f}" for val in sample_data],
+                            _LazyFmt(row),
                         )
-                        device_self.last_print = time.time()
 
                 return False  # Continue
 
@@ -161,9 +325,9 @@ class PluxDevice:
             channels, sensor_types, sensor_info, sources = get_sensor_info(self.device)
             self.channels = channels
             self.sensor_types = sensor_types
-            logger.info("Found %d sensors", len(sensor_types))
-            for port, sensor_type in sensor_types.items():
-                logger.info("Port %d: %s", port, sensor_type)
+            # get_sensor_info already logged per-port details in its single
+            # pass over the sensors; one summary line suffices here
+            logger.info("Found %d sensors: %s", len(sensor_types), sensor_types)
 
             # Apply any manual overrides if provided
             if hasattr(self, "manual_sensor_map") and self.manual_sensor_map:
@@ -185,23 +349,134 @@ class PluxDevice:
             self.channels = [1, 2]
             self.sensor_types = {1: "EDA", 2: "EMG"}
 
+        # Freeze the SpO2 port set and type snapshot once so later lookups
+        # and log calls avoid rebuilding them from the dict
+        self._spo2_ports = frozenset(
+            port
+            for port, sensor_type in self.sensor_types.items()
+            if sensor_type == "SpO2"
+        )
+        self._sensor_type_values = tuple(self.sensor_types.values())
+
+        # Build the source list once, after manual overrides settled the
+        # final types; each Source() constructor crosses into the PLUX SDK,
+        # so restarts reuse this list instead of rebuilding it
+        self._sources = []
+        for port in self.channels:
+            source = self.plux.Source()
+            source.port = port
+            source.freqDivisor = 1
+            source.nBits = 16
+            if port in self._spo2_ports:
+                # Both RED and INFRARED derivations (binary 11)
+                source.chMask = 0x03
+            self._sources.append(source)
+
     def _setup_lsl_stream(self) -> None:
         """Configure Lab Streaming Layer outlet for data transmission."""
-        channel_names = [
-            f"{self.sensor_types[port]}_CH{port}" for port in self.channels
-        ]
-        logger.info("Creating LSL stream with channels: %s", channel_names)
+        # Build the channel layout and the raw-frame index table in one pass.
+        # SpO2 ports carry two derivations (RED and INFRARED) per frame, so
+        # they fan out into two output channels.
+        channel_names: list[str] = []
+        channel_types: list[str] = []
+        gather_idx: list[int] = []
+        raw_index = 0
+        for port in self.channels:
+            sensor_type = self.sensor_types[port]
+            if sensor_type == "SpO2":
+                for derivation in ("RED", "INFRARED"):
+                    channel_names.append(f"SpO2_CH{port}_{derivation}")
+                    channel_types.append("SpO2")
+                    gather_idx.append(raw_index)
+                    raw_index += 1
+            else:
+                channel_names.append(f"{sensor_type}_CH{port}")
+                channel_types.append(sensor_type)
+                gather_idx.append(raw_index)
+                raw_index += 1
+
+        self._gather_idx = np.asarray(gather_idx, dtype=np.intp)
+        self._frame = np.zeros(raw_index, dtype=np.float32)
+        self._raw_width = raw_index
+
+        # Intern and freeze the labels: they are compared and logged for the
+        # lifetime of the stream, so identity-based equality pays off
+        self._channel_names = tuple(sys.intern(name) for name in channel_names)
+        logger.info("Creating LSL stream with channels: %s", self._channel_names)
 
         info = StreamInfo(
             name=self.stream_name,
             type="Physiological",
-            channel_count=len(channel_names),
+            channel_count=len(self._channel_names),
             nominal_srate=self.sampling_rate,
             channel_format="float32",
             source_id=self.stream_name,
         )
 
-        self.outlet = StreamOutlet(info)
+        # Add channel metadata; the type string was emitted alongside each
+        # label above, so no per-channel classification is needed here
+        channels_desc = info.desc().append_child("channels")
+        for name, ch_type in zip(self._channel_names, channel_types, strict=True):
+            ch = channels_desc.append_child("channel")
+            ch.append_child_value("label", name)
+            ch.append_child_value("unit", "microvolts")
+            ch.append_child_value("type", ch_type)
+
+        # Match the outlet's wire chunking to our batch size so liblsl
+        # coalesces sends instead of flushing tiny per-sample packets
+        self.outlet = StreamOutlet(info, chunk_size=self._batch_size, max_buffered=360)
+
+        # Preallocate the ring now that the channel count is fixed
+        self._ring = np.empty((_RING_SLOTS, len(self._channel_names)), dtype=np.float32)
+        self._ring_head = 0
+        self._ring_tail = 0
+        self._ring_dropped = 0
+
+    def _sender_loop(self) -> None:
+        """Drain the ring buffer to the LSL outlet until streaming stops."""
+        while True:
+            head = self._ring_head
+            tail = self._ring_tail
+            if tail == head:
+                if not self.running:
+                    break
+                # Empty: sleep about half a chunk so frames accumulate
+                time.sleep(BATCH_WINDOW_S / 2)
+                continue
+            self._push_ring_span(tail, head)
+            self._ring_tail = head
+        if self._ring_dropped:
+            logger.warning(
+                "Ring buffer overflowed: %d frames dropped", self._ring_dropped
+            )
+
+    def _push_ring_span(self, tail: int, head: int) -> None:
+        """Push ring rows in ``[tail, head)`` as contiguous chunks.
+
+        Args:
+            tail: Index of the first unsent frame.
+            head: Index one past the last frame published by the callback.
+        """
+        ring = self._ring
+        outlet = self.outlet
+        if ring is None or outlet is None:
+            return
+        start = tail & _RING_MASK
+        end = head & _RING_MASK
+        # A wrapped span splits into two contiguous slices; each is pushed
+        # without copying
+        spans = (ring[start:end],) if start < end else (ring[start:], ring[:end])
+        for span in spans:
+            if len(span):
+                # Derive the chunk timestamp from the sample counter and
+                # nominal rate; the clock was read once at acquisition start.
+                # Dropped frames still consumed acquisition time, so count
+                # them too - otherwise every chunk after an overflow would be
+                # stamped drops/rate seconds early for the rest of the run
+                self._pushed += len(span)
+                frames = self._pushed + self._ring_dropped
+                timestamp = self._t0 + frames / self.sampling_rate
+                outlet.push_chunk(span, timestamp)
 
     def start_streaming(self) -> None:
         """Start data acquisition and streaming to LSL outlet."""
@@ -210,23 +485,28 @@ class PluxDevice:
             raise RuntimeError(msg)
 
         logger.info("Starting acquisition on channels: %s", self.channels)
-        logger.info("Sensor types: %s", list(self.sensor_types.values()))
+        logger.info("Sensor types: %s", self._sensor_type_values)
         logger.info("Press Ctrl+C to stop...")
 
-        # Create sources
-        sources = []
-        for port in self.channels:
-            source = self.plux.Source()
-            source.port = port
-            source.freqDivisor = 1
-            source.nBits = 16
-            sources.append(source)
-
         # Start acquisition - the onRawFrame is already defined in WorkingDevice
+        self._callback_done.clear()
         self.running = True
+        self._t0 = local_clock()
+        self._pushed = 0
+        self._ring_head = 0
+        self._ring_tail = 0
+        self._ring_dropped = 0
+
+        # The sender drains the ring on its own thread so LSL-side stalls
+        # never backpressure the acquisition callback
+        self._sender = threading.Thread(
+            target=self._sender_loop, name="lsl-sender", daemon=True
+        )
+        self._sender.start()
 
         try:
-            self.device.start(self.sampling_rate, sources)
+            # Sources were configured once in _detect_sensors
+            self.device.start(self.sampling_rate, self._sources)
 
             # Use the working loop pattern from minimal_streaming.py
             logger.info("Starting data acquisition loop...")
@@ -248,10 +528,18 @@ class PluxDevice:
         logger.info("Stopping acquisition...")
         self.running = False
 
+        # The sender drains any remaining frames and exits once it sees
+        # running flip false with an empty ring; join so no tail is lost
+        if self._sender is not None:
+            self._sender.join(timeout=2.0)
+            self._sender = None
+
         if self.device:
             try:
-                # Give it a moment to finish current operations
-                time.sleep(0.1)
+                # Wait for the callback to acknowledge the stop request; this
+                # returns after at most one sample period instead of a fixed
+                # 100 ms grace sleep (the timeout covers a stalled callback)
+                self._callback_done.wait(timeout=1.0)
                 self.device.stop()
                 logger.info("Device stopped successfully")
             except Exception as e:
@@ -263,6 +551,11 @@ class PluxDevice:
             except Exception as e:
                 logger.warning("Warning during device close: %s", e)
 
+            # The handle is closed and unusable; drop it so a later
+            # connect_and_setup() reconnects instead of no-opping on it
+            self.device = None
+            self._sources = []
+
         # Clean up LSL outlet
         if self.outlet:
             try:
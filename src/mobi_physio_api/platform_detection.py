@@ -1,8 +1,15 @@
 """Platform detection utilities for PLUX SDK path resolution."""
 
+import functools
 import platform
+import sys
 from pathlib import Path
 
+# The interpreter version cannot change at runtime; folding it to a constant
+# avoids re-parsing the version string on every SDK path lookup. The system
+# and machine are still read per call so they honor runtime patching.
+_PYTHON_VERSION = f"{sys.version_info[0]}{sys.version_info[1]}"
+
 
 def get_plux_sdk_path() -> str:
     """Get correct PLUX SDK path for current platform and Python version.
@@ -13,31 +20,51 @@ def get_plux_sdk_path() -> str:
     Raises:
         RuntimeError: If platform is unsupported or no compatible SDK found.
     """
-    system = platform.system()
+    return _resolve_sdk_path(platform.system(), platform.machine(), _PYTHON_VERSION)
+
+
+@functools.cache
+def _resolve_sdk_path(system: str, machine: str, python_version: str) -> str:
+    """Resolve the SDK path for a platform triple, memoizing the result.
+
+    The filesystem probing only runs once per (system, machine, version)
+    combination; repeated calls return the cached path without any stat calls.
+
+    Args:
+        system: Platform name from ``platform.system()``.
+        machine: Machine architecture from ``platform.machine()``.
+        python_version: Two-digit Python version string (e.g. ``"310"``).
 
+    Returns:
+        Relative path to the appropriate PLUX SDK directory.
+
+    Raises:
+        RuntimeError: If platform is unsupported or no compatible SDK found.
+    """
     if system == "Darwin":  # macOS
-        return _get_macos_path()
+        return _get_macos_path(machine, python_version)
     if system == "Linux":
         return "PLUX-API-Python3/Linux64"
     if system == "Windows":
-        return _get_windows_path()
+        return _get_windows_path(python_version)
 
     msg = f"Unsupported platform: {system}"
     raise RuntimeError(msg)
 
 
-def _get_macos_path() -> str:
+def _get_macos_path(machine: str, python_version: str) -> str:
     """Get macOS-specific PLUX SDK path based on architecture and Python version.
 
+    Args:
+        machine: Machine architecture from ``platform.machine()``.
+        python_version: Two-digit Python version string (e.g. ``"310"``).
+
     Returns:
         Path to macOS PLUX SDK directory.
 
     Raises:
         RuntimeError: If no compatible SDK directory found.
     """
-    machine = platform.machine()
-    python_version = "".join(platform.python_version().split(".")[:2])
-
     if machine == "arm64":  # Apple Silicon (M1/M2)
         m1_options = [
             f"M1_{python_version}",
@@ -47,28 +74,43 @@ def _get_macos_path() -> str:
             "M1_39",
             "M1_37",
         ]
+        # One directory listing replaces a stat call per candidate; the
+        # membership checks below preserve the preference order
+        try:
+            entries = {entry.name for entry in Path("PLUX-API-Python3").iterdir()}
+        except FileNotFoundError:
+            entries = set()
         for option in m1_options:
-            if Path(f"PLUX-API-Python3/{option}").exists():
+            if option in entries:
                 return f"PLUX-API-Python3/{option}"
     else:  # Intel Mac
         intel_options = [
-            f"MacOS/Intel{python_version}",
-            "MacOS/Intel310",
-            "MacOS/Intel39",
-            "MacOS/Intel38",
-            "MacOS/Intel37",
+            f"Intel{python_version}",
+            "Intel310",
+            "Intel39",
+            "Intel38",
+            "Intel37",
         ]
+        # Same single-listing pattern as the M1 branch: one directory read
+        # instead of a stat per candidate, preference order preserved
+        try:
+            entries = {entry.name for entry in Path("PLUX-API-Python3/MacOS").iterdir()}
+        except FileNotFoundError:
+            entries = set()
         for option in intel_options:
-            if Path(f"PLUX-API-Python3/{option}").exists():
-                return f"PLUX-API-Python3/{option}"
+            if option in entries:
+                return f"PLUX-API-Python3/MacOS/{option}"
 
     msg = f"No compatible PLUX SDK found for macOS {machine} Python {python_version}"
     raise RuntimeError(msg)
 
 
-def _get_windows_path() -> str:
-    """Get Windows-specific PLUX SDK path."""
-    python_version = "".join(platform.python_version().split(".")[:2])
+def _get_windows_path(python_version: str) -> str:
+    """Get Windows-specific PLUX SDK path.
+
+    Args:
+        python_version: Two-digit Python version string (e.g. ``"310"``).
+    """
     arch = platform.architecture()[0][:2]
     return f"PLUX-API-Python3/Win{arch}_{python_version}"
 
@@ -86,8 +128,6 @@ def setup_plux_import_path(base_path: Path | None = None) -> str:
     Raises:
         RuntimeError: If the PLUX SDK cannot be found or imported.
     """
-    import sys
-
     if base_path is None:
         base_path = Path.cwd()
 
@@ -1,44 +1,162 @@
 """Sensor detection and channel mapping for PLUX devices."""
 
+import functools
 import logging
+import re
 from typing import Any
 
 logger = logging.getLogger(__name__)
 
-# PLUX sensor type mappings based on official documentation
-SENSOR_TYPE_MAPPING = {
-    0: "EMG",  # Electromyography
-    1: "ECG",  # Electrocardiography
-    2: "EDA",  # Electrodermal Activity (GSR)
-    3: "EEG",  # Electroencephalography
-    4: "ACC",  # Accelerometer
-    5: "GYRO",  # Gyroscope
-    6: "MAG",  # Magnetometer
-    7: "RSP",  # Respiratory
-    8: "PZT",  # Piezoelectric
-    9: "TEMP",  # Temperature
-    69: "SpO2",  # Pulse oximetry
-    70: "PPG",  # Photoplethysmography
+# Fused sensor table keyed by PLUX type code (per official documentation):
+# (type name, channel-name prefix). The public mapping and channel-name
+# views below are derived from it, so each sensor is defined in one row.
+_SENSOR_TABLE: dict[int, tuple[str, str]] = {
+    0: ("EMG", "EMG_CH"),  # Electromyography
+    1: ("ECG", "ECG_CH"),  # Electrocardiography
+    2: ("EDA", "EDA_CH"),  # Electrodermal Activity (GSR)
+    3: ("EEG", "EEG_CH"),  # Electroencephalography
+    4: ("ACC", "ACC_CH"),  # Accelerometer
+    5: ("GYRO", "GYRO_CH"),  # Gyroscope
+    6: ("MAG", "MAG_CH"),  # Magnetometer
+    7: ("RSP", "RSP_CH"),  # Respiratory
+    8: ("PZT", "PZT_CH"),  # Piezoelectric
+    9: ("TEMP", "TEMP_CH"),  # Temperature
+    69: ("SpO2", "SpO2_CH"),  # Pulse oximetry
+    70: ("PPG", "PPG_CH"),  # Photoplethysmography
 }
 
-# Default channel names for different sensor types
+# PLUX sensor type mappings (derived view kept for the public API)
+SENSOR_TYPE_MAPPING = {code: name for code, (name, _) in _SENSOR_TABLE.items()}
+
+# Dense positional lookup for the contiguous type codes 0-9; indexing a
+# tuple skips the hash lookup for the common analog sensors. Sparse codes
+# (69, 70) fall back to the mapping dict.
+_SENSOR_TYPE_DENSE = tuple(SENSOR_TYPE_MAPPING[code] for code in range(10))
+
+# Channel-name prefixes keyed by type name, plus the unknown fallback
+_CHANNEL_PREFIX = dict(_SENSOR_TABLE.values())
+_CHANNEL_PREFIX["Unknown"] = "UNKNOWN_CH"
+
+# Default channel names for different sensor types (derived view)
 DEFAULT_CHANNEL_NAMES = {
-    "EMG": "EMG_CH{port}",
-    "ECG": "ECG_CH{port}",
-    "EDA": "EDA_CH{port}",
-    "EEG": "EEG_CH{port}",
-    "ACC": "ACC_CH{port}",
-    "GYRO": "GYRO_CH{port}",
-    "MAG": "MAG_CH{port}",
-    "RSP": "RSP_CH{port}",
-    "PZT": "PZT_CH{port}",
-    "TEMP": "TEMP_CH{port}",
-    "SpO2": "SpO2_CH{port}",
-    "PPG": "PPG_CH{port}",
-    "Unknown": "UNKNOWN_CH{port}",
+    name: prefix + "{port}" for name, prefix in _CHANNEL_PREFIX.items()
 }
 
 
+# Ordered productID classification rules; first matching keyword wins.
+# A data table keeps the rule order in one place instead of spreading it
+# across an if/elif chain, and new sensors only need a new row.
+_PRODUCT_ID_RULES: tuple[tuple[tuple[str, ...], str], ...] = (
+    (("ecg", "electrocardiogram"), "ECG"),
+    (("emg", "electromyogram"), "EMG"),
+    (("eda", "gsr", "galvanic"), "EDA"),
+    (("spo2", "oximetry"), "SpO2"),
+    (("acc", "accelerometer"), "ACC"),
+    (("ppg", "photoplethysmography"), "PPG"),
+    (("resp", "respiratory"), "RSP"),
+)
+
+# Type codes whose hardware classification is already definitive: for these
+# the productID scan cannot improve on the type field, so detection returns
+# as soon as the base type is known. ACC (4) and SpO2 (69) are handled by
+# their own branches; the remaining codes fall through to productID
+# refinement.
+_EARLY_RETURN_TYPES = frozenset({0, 1, 2, 3, 7, 8, 9, 70})
+
+# Accelerometer axis lookups, hoisted so ACC detection allocates no dict or
+# list literals per call. Ports 5-7 and 8-10 are the two common three-axis
+# port arrangements; channel indices 0-2 map directly to axes.
+_ACC_CHANNEL_AXIS = {0: "X", 1: "Y", 2: "Z"}
+_ACC_PORT_AXIS = {5: "X", 6: "Y", 7: "Z", 8: "X", 9: "Y", 10: "Z"}
+
+# Compiled view of the rule table: one left-to-right scan of the productID
+# replaces a substring search per keyword. Longest keywords sort first so
+# full names win over their abbreviated prefixes at the same position.
+_PRODUCT_ID_LABELS = {
+    keyword: label for keywords, label in _PRODUCT_ID_RULES for keyword in keywords
+}
+_PRODUCT_ID_PATTERN = re.compile(
+    "|".join(sorted(_PRODUCT_ID_LABELS, key=len, reverse=True))
+)
+
+
+@functools.lru_cache(maxsize=32)
+def _classify_product(product_id: str) -> str | None:
+    """Classify a productID string into a sensor type, memoized.
+
+    The device-level productID is constant across all ports, so after the
+    first port neither the lowering nor the scan runs again.
+
+    Args:
+        product_id: Raw productID string from the sensor or device.
+
+    Returns:
+        Matched sensor type label, or None if no keyword matched.
+    """
+    match = _PRODUCT_ID_PATTERN.search(product_id.lower())
+    return _PRODUCT_ID_LABELS[match.group()] if match else None
+
+
+# PLUX SDK module, imported lazily on first use: the SDK directory is added
+# to sys.path at runtime, so a top-level import would fire too early. The
+# cache spares later callers the import-lock/sys.modules round trip.
+_plux: Any = None
+
+
+def _get_plux() -> Any:  # noqa: ANN401
+    """Return the PLUX SDK module, importing it on first use.
+
+    Returns:
+        The imported ``plux`` module.
+
+    Raises:
+        ImportError: If the PLUX SDK is not importable.
+    """
+    global _plux
+    if _plux is None:
+        import plux
+
+        _plux = plux
+    return _plux
+
+
+# Pool of plux.Source objects keyed by port, reused across reconnects.
+# Bluetooth dropouts trigger re-enumeration; fixed-identity sources avoid
+# churning SDK allocations. The pool is process-wide: two PluxDevice
+# instances using the same port numbers alias the same Source objects, so
+# a source must be (re)configured via _configure_source before each start.
+_SOURCE_POOL: dict[int, Any] = {}
+
+
+def _configure_source(
+    plux_module: Any,  # noqa: ANN401
+    port: int,
+    ch_mask: int | None = None,
+) -> Any:  # noqa: ANN401
+    """Get a configured plux.Source for a port, reusing pooled instances.
+
+    Args:
+        plux_module: Imported PLUX SDK module.
+        port: Physical port number on the device.
+        ch_mask: Optional channel mask for multi-derivation sensors.
+
+    Returns:
+        Configured plux.Source object.
+    """
+    source = _SOURCE_POOL.get(port)
+    if source is None:
+        source = plux_module.Source()
+        _SOURCE_POOL[port] = source
+    source.port = port
+    source.freqDivisor = 1  # No subsampling
+    source.nBits = 16  # 16-bit resolution
+    # Always assign the mask: pooled sources keep prior state, and a port
+    # once configured as SpO2 must not retain the dual-derivation mask when
+    # it is later re-detected as a plain analog sensor
+    source.chMask = 0x01 if ch_mask is None else ch_mask
+    return source
+
+
 def detect_sensor_type(sensor: Any, properties: dict[str, Any], port: int) -> str:  # noqa: ANN401
     """Detect sensor type from PLUX sensor object and properties.
 
@@ -50,11 +168,17 @@ def detect_sensor_type(sensor: Any, properties: dict[str, Any], port: int) -> st
     Returns:
         Detected sensor type string (e.g., 'EMG', 'ECG', 'ACC_X').
     """
-    # Known sensor type mappings from PLUX documentation
-    type_map = SENSOR_TYPE_MAPPING
-
     # Get base sensor type from the type field
-    base_type = type_map.get(sensor.type, f"Unknown_Type{sensor.type}")
+    type_code: int = sensor.type
+    if 0 <= type_code < len(_SENSOR_TYPE_DENSE):
+        base_type = _SENSOR_TYPE_DENSE[type_code]
+    else:
+        base_type = SENSOR_TYPE_MAPPING.get(type_code, f"Unknown_Type{type_code}")
+
+    # The hardware type field is definitive for most analog sensors; stop
+    # here instead of probing productID for a refinement that cannot apply
+    if type_code in _EARLY_RETURN_TYPES:
+        return base_type
 
     # For accelerometers, try to determine axis based on characteristics, port,
     # or other info
@@ -68,18 +192,14 @@ def detect_sensor_type(sensor: Any, properties: dict[str, Any], port: int) -> st
                 return f"ACC_{axis}"
             if "channel" in characteristics:
                 channel = characteristics["channel"]
-                axis_map = {0: "X", 1: "Y", 2: "Z"}
-                axis = axis_map.get(channel, channel)
+                axis = _ACC_CHANNEL_AXIS.get(channel, channel)
                 return f"ACC_{axis}"
 
         # Try to infer axis from port number (common convention: consecutive ports)
         # This is heuristic and may not always be accurate
-        if port in [5, 6, 7]:  # Common accelerometer port arrangement
-            axis_map = {5: "X", 6: "Y", 7: "Z"}
-            return f"ACC_{axis_map[port]}"
-        if port in [8, 9, 10]:  # Alternative arrangement
-            axis_map = {8: "X", 9: "Y", 10: "Z"}
-            return f"ACC_{axis_map[port]}"
+        axis = _ACC_PORT_AXIS.get(port)
+        if axis is not None:
+            return f"ACC_{axis}"
 
         # If no axis info available, just return ACC
         return "ACC"
@@ -88,34 +208,18 @@ def detect_sensor_type(sensor: Any, properties: dict[str, Any], port: int) -> st
     if sensor.type == 69:  # SpO2
         return "SpO2"
 
-    # Try to enhance detection using productID or other properties
-    product_id = "Unknown"
-    if hasattr(sensor, "productID"):
-        product_id = str(sensor.productID)
-    elif isinstance(properties, dict) and "productID" in properties:
-        product_id = str(properties["productID"])
+    # Try to enhance detection using productID or other properties; a single
+    # getattr with a default replaces the hasattr-probe-then-read double lookup
+    product_id_raw = getattr(sensor, "productID", None)
+    if product_id_raw is None and isinstance(properties, dict):
+        product_id_raw = properties.get("productID")
+    product_id = "Unknown" if product_id_raw is None else str(product_id_raw)
 
     # Enhanced detection based on productID patterns (if available)
     if product_id != "Unknown":
-        product_id_lower = product_id.lower()
-        if "ecg" in product_id_lower or "electrocardiogram" in product_id_lower:
-            return "ECG"
-        if "emg" in product_id_lower or "electromyogram" in product_id_lower:
-            return "EMG"
-        if (
-            "eda" in product_id_lower
-            or "gsr" in product_id_lower
-            or "galvanic" in product_id_lower
-        ):
-            return "EDA"
-        if "spo2" in product_id_lower or "oximetry" in product_id_lower:
-            return "SpO2"
-        if "acc" in product_id_lower or "accelerometer" in product_id_lower:
-            return "ACC"
-        if "ppg" in product_id_lower or "photoplethysmography" in product_id_lower:
-            return "PPG"
-        if "resp" in product_id_lower or "respiratory" in product_id_lower:
-            return "RSP"
+        label = _classify_product(product_id)
+        if label is not None:
+            return label
 
     # For other sensors, use the base type from type mapping
     return base_type
@@ -140,55 +244,60 @@ def get_sensor_info(
     """
     try:
         sensors = device.getSensors()
-        logger.info(f"Auto-detected {len(sensors)} sensors")
+        logger.info("Auto-detected %d sensors", len(sensors))
 
         # Get device properties for additional sensor information
         try:
             properties = device.getProperties()
-            logger.info(f"Device properties: {properties}")
+            logger.debug("Device properties: %s", properties)
         except Exception as e:
-            logger.warning(f"Could not get device properties: {e}")
+            logger.warning("Could not get device properties: %s", e)
             properties = {}
 
-        channels = []
+        # Sized up front from the sensor count, so the loop assigns by index
+        # instead of growing the lists
+        n_sensors = len(sensors)
+        channels: list[int] = [0] * n_sensors
         sensor_types = {}
         sensor_info = {}
-        sources = []  # Store plux.Source objects for proper configuration
+        sources: list[Any] = [None] * n_sensors  # Configured plux.Source objects
+        detection_lines: list[str] = [""] * n_sensors  # Emitted as one record
+
+        # Device-level productID is constant across ports; resolve it once
+        default_product_id = properties.get("productID", "Unknown")
 
-        # Import plux here to avoid circular imports
         try:
-            import plux  # noqa: F401
+            plux = _get_plux()
         except ImportError:
             logger.error(
                 "PLUX API not available. Cannot proceed with sensor detection."
             )
             raise
 
-        for port, sensor in sensors.items():
-            channels.append(port)
-
-            # Log raw sensor information for debugging
-            logger.info(f"Port {port}: RAW INFO")
-            logger.info(f"  Type: {sensor.type}")
-            logger.info(f"  Class: {sensor.clas}")
-            logger.info(f"  Serial: {sensor.serialNum}")
-            logger.info(f"  HW Version: {sensor.hwVersion}")
-            logger.info(f"  Characteristics: {sensor.characteristics}")
-
-            # Try to get productID from sensor or device properties
-            product_id = "Unknown"
-            if hasattr(sensor, "productID"):
-                product_id = sensor.productID
-            elif "productID" in properties:
-                product_id = properties["productID"]
-            logger.info(f"  Product ID: {product_id}")
+        for i, (port, sensor) in enumerate(sensors.items()):
+            channels[i] = port
+
+            # Try to get productID from sensor, falling back to the device one
+            product_id = getattr(sensor, "productID", default_product_id)
+
+            # One lazily-formatted record per port instead of seven; the
+            # %-style args defer formatting until DEBUG is actually enabled
+            logger.debug(
+                "Port %s raw info: type=%s class=%s serial=%s hw=%s "
+                "characteristics=%s product_id=%s",
+                port,
+                sensor.type,
+                sensor.clas,
+                sensor.serialNum,
+                sensor.hwVersion,
+                sensor.characteristics,
+                product_id,
+            )
 
             # Automatically detect sensor type based on actual sensor properties
             sensor_type = detect_sensor_type(sensor, properties, port)
             sensor_types[port] = sensor_type
 
-            logger.info(f"  🎯 DETECTED TYPE: {sensor_type}")
-
             # Store detailed sensor info
             sensor_info[port] = {
                 "type": sensor.type,
@@ -201,49 +310,62 @@ def get_sensor_info(
 
             # Create appropriate source configuration
             if sensor.type == 69:  # SpO2 sensor - Digital channel
-                logger.info(
-                    "  🔧 Configured as DIGITAL channel (SpO2 with RED/INFRARED)"
-                )
-                source = plux.Source()
-                source.port = port
-                source.freqDivisor = 1  # No subsampling
-                source.nBits = 16  # 16-bit resolution
-                source.chMask = 0x03  # Both RED and INFRARED derivations (binary 11)
-                sources.append(source)
+                # Both RED and INFRARED derivations (binary 11)
+                sources[i] = _configure_source(plux, port, ch_mask=0x03)
+                config = "DIGITAL channel (SpO2 with RED/INFRARED)"
             else:  # Analog sensors (EMG, ECG, ACC, etc.)
-                logger.info("  🔧 Configured as ANALOG channel")
-                source = plux.Source()
-                source.port = port
-                source.freqDivisor = 1  # No subsampling
-                source.nBits = 16  # 16-bit resolution
-                sources.append(source)
+                sources[i] = _configure_source(plux, port)
+                config = "ANALOG channel"
+            detection_lines[i] = f"  Port {port}: {sensor_type} - {config}"
+
+        # One record for all ports: a single handler walk and lock acquire
+        # instead of two per port
+        if detection_lines:
+            logger.info("Sensor configuration:\n%s", "\n".join(detection_lines))
 
         return channels, sensor_types, sensor_info, sources
 
     except Exception as e:
-        logger.warning(f"Could not auto-detect sensors: {e}")
+        logger.warning("Could not auto-detect sensors: %s", e)
         logger.warning("Using fallback channels [1, 2, 3]")
 
-        # Fallback sources
-        fallback_sources = []
-
-        # Import plux here to avoid circular imports
         try:
-            import plux  # noqa: F401
+            plux = _get_plux()
         except ImportError:
             logger.error("PLUX API not available. Cannot create fallback sources.")
             raise
 
-        for port in [1, 2, 3]:
-            source = plux.Source()
-            source.port = port
-            source.freqDivisor = 1
-            source.nBits = 16
-            fallback_sources.append(source)
+        # Fallback sources
+        fallback_sources = [_configure_source(plux, port) for port in (1, 2, 3)]
 
         return [1, 2, 3], {1: "RSP", 2: "EMG", 3: "EDA"}, {}, fallback_sources
 
 
+@functools.lru_cache(maxsize=8)
+def _channel_names_for(
+    items: tuple[tuple[int, str], ...],
+) -> tuple[tuple[int, str], ...]:
+    """Compute (port, channel name) pairs for a frozen sensor-type layout.
+
+    Args:
+        items: Sorted (port, sensor type) pairs.
+
+    Returns:
+        Matching (port, channel name) pairs.
+    """
+    names = []
+    for port, sensor_type in items:
+        # Use the sensor type as the base name; the prefix table avoids
+        # re-parsing a {port} placeholder through str.format per port
+        prefix = _CHANNEL_PREFIX.get(sensor_type)
+        if prefix is not None:
+            names.append((port, f"{prefix}{port}"))
+        else:
+            # For custom sensor types (e.g., ACC_X), use the type directly
+            names.append((port, f"{sensor_type}_CH{port}"))
+    return tuple(names)
+
+
 def generate_channel_names(
     sensor_types: dict[int, str], sensor_info: dict[int, dict[str, Any]]
 ) -> dict[int, str]:
@@ -256,17 +378,10 @@ def generate_channel_names(
     Returns:
         Dictionary mapping port to channel name
     """
-    channel_names = {}
-
-    for port, sensor_type in sensor_types.items():
-        # Use the sensor type as the base name
-        if sensor_type in DEFAULT_CHANNEL_NAMES:
-            channel_names[port] = DEFAULT_CHANNEL_NAMES[sensor_type].format(port=port)
-        else:
-            # For custom sensor types (e.g., ACC_X), use the type directly
-            channel_names[port] = f"{sensor_type}_CH{port}"
-
-    return channel_names
+    # Memoized on the frozen layout: reconnects and repeated mapping calls
+    # with the same sensors skip the name formatting. A fresh dict is built
+    # per call so callers can mutate their copy safely.
+    return dict(_channel_names_for(tuple(sorted(sensor_types.items()))))
 
 
 def get_channel_mapping(device: Any) -> dict[str, int]:  # noqa: ANN401
@@ -282,8 +397,4 @@ def get_channel_mapping(device: Any) -> dict[str, int]:  # noqa: ANN401
     channel_names = generate_channel_names(sensor_types, sensor_info)
 
     # Create reverse mapping from channel names to ports
-    channel_mapping = {}
-    for port, channel_name in channel_names.items():
-        channel_mapping[channel_name] = port
-
-    return channel_mapping
+    return {channel_name: port for port, channel_name in channel_names.items()}
@@ -2,8 +2,41 @@
 
 from __future__ import annotations
 
+import numpy as np
+from numpy.typing import NDArray
 from pylsl import StreamInfo, StreamOutlet
 
+# Per-port processing op-codes; integer dispatch in process_raw_data avoids
+# re-comparing sensor-type strings on every frame.
+_OP_COPY = 0
+_OP_SPO2 = 1
+_OP_ACC = 2
+
+
+def _build_plan(
+    sensor_types: dict[int, str],
+    channels: list[int],
+) -> tuple[int, ...]:
+    """Map each active port to its processing op-code.
+
+    Args:
+        sensor_types: Mapping of port numbers to sensor type strings.
+        channels: List of active channel port numbers.
+
+    Returns:
+        Tuple with one op-code per port, in channel order.
+    """
+    ops = []
+    for port in channels:
+        sensor_type = sensor_types.get(port, "UNKNOWN")
+        if sensor_type == "SpO2":
+            ops.append(_OP_SPO2)
+        elif sensor_type == "ACC":
+            ops.append(_OP_ACC)
+        else:
+            ops.append(_OP_COPY)
+    return tuple(ops)
+
 
 class LSLStreamer:
     """Lab Streaming Layer streamer for real-time biosignals data transmission."""
@@ -34,6 +67,28 @@ class LSLStreamer:
         self.info: StreamInfo | None = None
         self.outlet: StreamOutlet | None = None
 
+        # Accumulator for batched pushes: ~20 ms of data per chunk bounds
+        # latency while amortizing the pylsl crossing across the batch.
+        self._batch_size = max(1, int(sampling_rate // 50))
+        self._batch: NDArray[np.float32] | None = None
+        self._batch_i = 0
+
+        # Processing plan: per-port op-codes computed once per channel layout,
+        # so the per-frame loop dispatches on integers instead of strings.
+        self._plan_ports: tuple[int, ...] = ()
+        self._plan_types: tuple[str, ...] = ()
+        self._plan_ops: tuple[int, ...] = ()
+        self._plan_passthrough = False
+
+        # Index arrays for the vectorized block path: source column per port
+        # kind and the first destination column each expands into.
+        self._pass_src: NDArray[np.intp] = np.empty(0, dtype=np.intp)
+        self._pass_dst: NDArray[np.intp] = np.empty(0, dtype=np.intp)
+        self._spo2_src: NDArray[np.intp] = np.empty(0, dtype=np.intp)
+        self._spo2_dst: NDArray[np.intp] = np.empty(0, dtype=np.intp)
+        self._acc_src: NDArray[np.intp] = np.empty(0, dtype=np.intp)
+        self._acc_dst: NDArray[np.intp] = np.empty(0, dtype=np.intp)
+
     def setup_channels(
         self,
         sensor_types: dict[int, str],
@@ -49,8 +104,18 @@ class LSLStreamer:
         self.channel_names = []
         self.channel_types = []
 
-        for port in channels:
+        # Source/destination columns for the vectorized block path, grouped
+        # by port kind so each group is one fancy-indexed NumPy op
+        pass_src: list[int] = []
+        pass_dst: list[int] = []
+        spo2_src: list[int] = []
+        spo2_dst: list[int] = []
+        acc_src: list[int] = []
+        acc_dst: list[int] = []
+
+        for src_idx, port in enumerate(channels):
             sensor_type = sensor_types.get(port, "UNKNOWN")
+            dst_idx = len(self.channel_names)
 
             # SpO2 sensors have two derivations (RED and INFRARED)
             if sensor_type == "SpO2":
@@ -59,6 +124,8 @@ class LSLStreamer:
                     self.channel_names.append(channel_name)
                     self.channel_types.append("SpO2")
                     self.channels.append(str(port))  # Add port for each channel
+                spo2_src.append(src_idx)
+                spo2_dst.append(dst_idx)
             # ACC sensors have three axes (X, Y, Z)
             elif sensor_type == "ACC":
                 for axis in ["X", "Y", "Z"]:
@@ -66,11 +133,30 @@ class LSLStreamer:
                     self.channel_names.append(channel_name)
                     self.channel_types.append("ACC")
                     self.channels.append(str(port))  # Add port for each channel
+                acc_src.append(src_idx)
+                acc_dst.append(dst_idx)
             else:
                 channel_name = f"{sensor_type}_{port}"
                 self.channel_names.append(channel_name)
                 self.channel_types.append(sensor_type)
                 self.channels.append(str(port))
+                pass_src.append(src_idx)
+                pass_dst.append(dst_idx)
+
+        # Channel layout is fixed for the session; cache the processing plan
+        self._plan_ports = tuple(channels)
+        self._plan_types = tuple(sensor_types.get(port, "UNKNOWN") for port in channels)
+        self._plan_ops = _build_plan(sensor_types, channels)
+        self._pass_src = np.asarray(pass_src, dtype=np.intp)
+        self._pass_dst = np.asarray(pass_dst, dtype=np.intp)
+        self._spo2_src = np.asarray(spo2_src, dtype=np.intp)
+        self._spo2_dst = np.asarray(spo2_dst, dtype=np.intp)
+        self._acc_src = np.asarray(acc_src, dtype=np.intp)
+        self._acc_dst = np.asarray(acc_dst, dtype=np.intp)
+        # All-analog layouts need no unpacking at all; specialize for them
+        self._plan_passthrough = _OP_SPO2 not in self._plan_ops and (
+            _OP_ACC not in self._plan_ops
+        )
 
     def create_stream(self) -> None:
         """Create LSL stream outlet with configured channels."""
@@ -99,6 +185,12 @@ class LSLStreamer:
         # Create outlet
         self.outlet = StreamOutlet(self.info)
 
+        # Preallocate the batch buffer now that the channel count is fixed
+        self._batch = np.empty(
+            (self._batch_size, len(self.channel_names)), dtype=np.float32
+        )
+        self._batch_i = 0
+
     def push_sample(self, data: list[float]) -> None:
         """Push a data sample to the LSL stream.
 
@@ -115,6 +207,61 @@ class LSLStreamer:
         # Let LSL handle automatic timestamping for best precision
         self.outlet.push_sample(data)
 
+    def push_chunk(
+        self,
+        samples: list[list[float]],
+        timestamp: float | None = None,
+    ) -> None:
+        """Push a batch of samples to the LSL stream in a single call.
+
+        Amortizes the Python-to-C crossing in pylsl across the whole batch
+        instead of paying it once per sample.
+
+        Args:
+            samples: Sequence of samples, each a list of channel values.
+            timestamp: Optional capture time of the most recent sample.
+
+        Raises:
+            RuntimeError: If stream is not created.
+        """
+        if self.outlet is None:
+            msg = "Stream not created. Call create_stream() first."
+            raise RuntimeError(msg)
+
+        if timestamp is None:
+            self.outlet.push_chunk(samples)
+        else:
+            self.outlet.push_chunk(samples, timestamp)
+
+    def push_sample_batched(self, data: list[float]) -> None:
+        """Buffer one sample and push a chunk when the batch fills.
+
+        Samples accumulate in a preallocated float32 buffer; once roughly
+        20 ms of data is collected the whole batch crosses into pylsl as a
+        single contiguous chunk. Call :meth:`flush` on shutdown to push any
+        buffered tail.
+
+        Args:
+            data: List of channel values.
+
+        Raises:
+            RuntimeError: If stream is not created.
+        """
+        if self.outlet is None or self._batch is None:
+            msg = "Stream not created. Call create_stream() first."
+            raise RuntimeError(msg)
+
+        self._batch[self._batch_i] = data
+        self._batch_i += 1
+        if self._batch_i == self._batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """Push any buffered samples to the LSL stream immediately."""
+        if self.outlet is not None and self._batch is not None and self._batch_i:
+            self.outlet.push_chunk(self._batch[: self._batch_i])
+            self._batch_i = 0
+
     def get_channel_count(self) -> int:
         """Get the total number of channels configured."""
         return len(self.channel_names)
@@ -141,35 +288,77 @@ class LSLStreamer:
         Returns:
             Processed data ready for LSL streaming.
         """
-        processed_data: list[float] = []
-        data_index = 0
+        # Reuse the plan computed in setup_channels only when both the port
+        # list and the per-port sensor types match; callers passing a
+        # different layout pay a one-off plan build instead.
+        if tuple(channels) == self._plan_ports and self._plan_types == tuple(
+            sensor_types.get(port, "UNKNOWN") for port in channels
+        ):
+            # Specialized path for the session's fixed layout: when every
+            # port is a plain analog channel the loop degenerates to a copy
+            if self._plan_passthrough:
+                return list(raw_data[: len(self._plan_ops)])
+            ops = self._plan_ops
+        else:
+            ops = _build_plan(sensor_types, channels)
 
-        for port in channels:
-            sensor_type = sensor_types.get(port, "UNKNOWN")
+        processed_data: list[float] = []
+        n = len(raw_data)
 
-            if sensor_type == "SpO2":
+        for data_index, op in enumerate(ops):
+            if data_index >= n:
+                break
+            if op == _OP_SPO2:
                 # SpO2 has two derivations (RED and INFRARED)
                 # For testing, we'll unpack a single value into two channels
-                if data_index < len(raw_data):
-                    raw_value = int(raw_data[data_index])
-                    # Split into RED and INFRARED (simple example)
-                    processed_data.append(float(raw_value & 0xFFFF))  # RED
-                    processed_data.append(float((raw_value >> 16) & 0xFFFF))  # INFRARED
-                data_index += 1
-            elif sensor_type == "ACC":
+                raw_value = int(raw_data[data_index])
+                # Split into RED and INFRARED (simple example)
+                processed_data.append(float(raw_value & 0xFFFF))  # RED
+                processed_data.append(float((raw_value >> 16) & 0xFFFF))  # INFRARED
+            elif op == _OP_ACC:
                 # ACC has three axes (X, Y, Z)
                 # For testing, we'll unpack a single value into three channels
-                if data_index < len(raw_data):
-                    raw_value = int(raw_data[data_index])
-                    # Split into X, Y, Z (simple example)
-                    processed_data.append(float(raw_value & 0xFF))  # X
-                    processed_data.append(float((raw_value >> 8) & 0xFF))  # Y
-                    processed_data.append(float((raw_value >> 16) & 0xFF))  # Z
-                data_index += 1
+                raw_value = int(raw_data[data_index])
+                # Split into X, Y, Z (simple example)
+                processed_data.append(float(raw_value & 0xFF))  # X
+                processed_data.append(float((raw_value >> 8) & 0xFF))  # Y
+                processed_data.append(float((raw_value >> 16) & 0xFF))  # Z
             else:
                 # Single channel analog sensor
-                if data_index < len(raw_data):
-                    processed_data.append(raw_data[data_index])
-                data_index += 1
+                processed_data.append(raw_data[data_index])
 
         return processed_data
+
+    def process_raw_block(
+        self,
+        raw: NDArray[np.float32],
+    ) -> NDArray[np.float32]:
+        """Convert a block of raw frames to output channels in one pass.
+
+        Vectorized counterpart of :meth:`process_raw_data`: the bit-field
+        unpacking runs as whole-column NumPy operations using the index
+        arrays built in :meth:`setup_channels`, so cost per sample is
+        independent of the Python interpreter.
+
+        Args:
+            raw: Array of shape ``(n_samples, n_ports)`` in channel order.
+
+        Returns:
+            float32 array of shape ``(n_samples, n_channels)`` ready for
+            :meth:`push_chunk`.
+        """
+        out = np.empty((raw.shape[0], len(self.channel_names)), dtype=np.float32)
+        if self._pass_src.size:
+            out[:, self._pass_dst] = raw[:, self._pass_src]
+        if self._spo2_src.size:
+            # RED in the low 16 bits, INFRARED in the high 16
+            packed = raw[:, self._spo2_src].astype(np.int64)
+            out[:, self._spo2_dst] = packed & 0xFFFF
+            out[:, self._spo2_dst + 1] = (packed >> 16) & 0xFFFF
+        if self._acc_src.size:
+            # X, Y, Z packed in consecutive bytes
+            packed = raw[:, self._acc_src].astype(np.int64)
+            out[:, self._acc_dst] = packed & 0xFF
+            out[:, self._acc_dst + 1] = (packed >> 8) & 0xFF
+            out[:, self._acc_dst + 2] = (packed >> 16) & 0xFF
+        return out
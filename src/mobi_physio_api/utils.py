@@ -1,10 +1,13 @@
 """Utility functions for signal handling and process management."""
 
+import ctypes
 import logging
 import os
+import platform
 import signal
 import subprocess
 import threading
+from pathlib import Path
 from types import FrameType
 from typing import Protocol
 
@@ -17,16 +20,52 @@ class DeviceProtocol(Protocol):
 
 logger = logging.getLogger(__name__)
 
-# Global flag for emergency shutdown
+# The platform cannot change at runtime; folding the check at import lets
+# MAC formatting skip a platform.system() call per invocation.
+_IS_WINDOWS = platform.system() == "Windows"
+
+# Global flag for emergency shutdown. The Event provides wait() semantics;
+# the ctypes int mirrors it for the acquisition callback, which polls every
+# frame and reads a plain C int instead of going through a bound method.
 _emergency_shutdown = threading.Event()
+_emergency_flag = ctypes.c_int(0)
+
+
+def _terminate_plux_processes() -> bool:
+    """Terminate stuck PLUX helper processes by scanning /proc directly.
+
+    Avoids the fork/exec round-trip of shelling out to pkill, which matters
+    when cleanup runs during shutdown.
+
+    Returns:
+        True if the scan ran, False if /proc is unavailable (non-Linux).
+    """
+    if not Path("/proc").is_dir():
+        return False
+    own_pid = os.getpid()
+    for entry in os.scandir("/proc"):
+        if not entry.name.isdigit() or int(entry.name) == own_pid:
+            continue
+        try:
+            cmdline = Path(entry.path, "cmdline").read_bytes()
+        except OSError:
+            continue
+        if b"bth_macprocess" in cmdline or b"plux" in cmdline:
+            try:
+                os.kill(int(entry.name), signal.SIGTERM)
+            except (ProcessLookupError, PermissionError):
+                continue
+    return True
 
 
 def cleanup_plux_processes() -> None:
     """Clean up any stuck PLUX background processes."""
     logger.info("Cleaning up PLUX processes...")
     try:
-        subprocess.run(["pkill", "-f", "bth_macprocess"], check=False)
-        subprocess.run(["pkill", "-f", "plux"], check=False)
+        if not _terminate_plux_processes():
+            # No /proc to scan (macOS/Windows): one pkill with an
+            # alternation pattern walks the process table once
+            subprocess.run(["pkill", "-f", "bth_macprocess|plux"], check=False)
         logger.info("Cleanup completed")
     except Exception as e:
         logger.warning("Cleanup warning: %s", e)
@@ -40,23 +79,26 @@ def setup_signal_handler(device_instance: DeviceProtocol | None) -> None:
     """
 
     def signal_handler(sig: int, frame: FrameType | None) -> None:
-        """Handle Ctrl+C signal for graceful shutdown."""
-        logger.info("Interrupt received (Ctrl+C), shutting down immediately...")
-
-        # Set global emergency flag
+        """Handle Ctrl+C: graceful stop first, forced exit on repeat."""
+        if _emergency_flag.value:
+            # Second interrupt: the graceful path is stuck; bail out hard
+            logger.info("Second interrupt received, forcing exit")
+            os._exit(1)
+
+        logger.info("Interrupt received (Ctrl+C), shutting down...")
+
+        # Set global emergency flag; only cheap, async-signal-safe work
+        # happens here. The acquisition callback observes the flag, returns
+        # True to stop the SDK loop, and the normal stop path unwinds with
+        # finalizers intact - flushing buffered LSL samples instead of
+        # dropping them with os._exit
+        _emergency_flag.value = 1
         _emergency_shutdown.set()
 
         # Stop device if available
         if device_instance and hasattr(device_instance, "running"):
             device_instance.running = False
 
-        # Clean up processes
-        cleanup_plux_processes()
-
-        # Force exit immediately
-        logger.info("Shutdown initiated. Exiting...")
-        os._exit(0)
-
     signal.signal(signal.SIGINT, signal_handler)
 
 
@@ -66,7 +108,8 @@ def is_emergency_shutdown() -> bool:
     Returns:
         True if shutdown is in progress, False otherwise.
     """
-    return _emergency_shutdown.is_set()
+    # Read the mirrored C int: no method dispatch on the per-frame poll
+    return _emergency_flag.value != 0
 
 
 def format_mac_address(mac_address: str) -> str:
@@ -78,8 +121,6 @@ def format_mac_address(mac_address: str) -> str:
     Returns:
         Formatted MAC address (adds BTH prefix on Windows).
     """
-    import platform
-
-    if platform.system() == "Windows" and not mac_address.startswith("BTH"):
+    if _IS_WINDOWS and not mac_address.startswith("BTH"):
         return f"BTH{mac_address}"
     return mac_address  # Keep original format for macOS/Linux
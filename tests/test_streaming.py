@@ -2,6 +2,8 @@
 
 from unittest.mock import Mock, patch
 
+import numpy as np
+
 from mobi_physio_api.streaming import LSLStreamer
 
 
@@ -156,6 +158,21 @@ class TestLSLStreamer:
         # Should unpack into 3 channels (X, Y, Z)
         assert len(processed) == 3
 
+    def test_process_raw_block_matches_per_sample_path(self) -> None:
+        """Test that the vectorized block path matches process_raw_data."""
+        streamer = LSLStreamer("test", sampling_rate=1000.0)
+        sensor_types = {1: "EMG", 2: "SpO2", 3: "ACC"}
+        channels = [1, 2, 3]
+        streamer.setup_channels(sensor_types, channels)
+
+        raw = [[123.0, 12345.0, 123456.0], [45.0, 67890.0, 654321.0]]
+        block = streamer.process_raw_block(np.asarray(raw, dtype=np.float32))
+
+        assert block.shape == (2, 6)  # 1 + 2 + 3 output channels
+        for row, sample in zip(block, raw, strict=True):
+            expected = streamer.process_raw_data(sample, sensor_types, channels)
+            assert row.tolist() == expected
+
     def test_push_sample(self) -> None:
         """Test sample pushing to LSL stream."""
         streamer = LSLStreamer("test", 1000.0)
@@ -167,3 +184,53 @@ class TestLSLStreamer:
         streamer.push_sample(data)
 
         mock_outlet.push_sample.assert_called_once_with(data)
+
+    def test_push_chunk(self) -> None:
+        """Test batched sample pushing to LSL stream."""
+        streamer = LSLStreamer("test", sampling_rate=1000.0)
+        mock_outlet = Mock()
+        streamer.outlet = mock_outlet
+
+        samples = [[1.0, 2.0], [3.0, 4.0]]
+
+        streamer.push_chunk(samples)
+
+        mock_outlet.push_chunk.assert_called_once_with(samples)
+
+    def test_push_chunk_with_timestamp(self) -> None:
+        """Test batched sample pushing with an explicit timestamp."""
+        streamer = LSLStreamer("test", sampling_rate=1000.0)
+        mock_outlet = Mock()
+        streamer.outlet = mock_outlet
+
+        samples = [[1.0, 2.0]]
+
+        streamer.push_chunk(samples, timestamp=123.45)
+
+        mock_outlet.push_chunk.assert_called_once_with(samples, 123.45)
+
+    def test_push_sample_batched_flushes_when_full(self) -> None:
+        """Test that batched pushes accumulate and flush as one chunk."""
+        streamer = LSLStreamer("test", sampling_rate=100.0)  # Batch size 2
+        mock_outlet = Mock()
+        streamer.outlet = mock_outlet
+        streamer.channel_names = ["EMG_1", "EDA_2"]
+        streamer._batch = np.empty((2, 2), dtype=np.float32)
+
+        streamer.push_sample_batched([1.0, 2.0])
+        mock_outlet.push_chunk.assert_not_called()
+
+        streamer.push_sample_batched([3.0, 4.0])
+        mock_outlet.push_chunk.assert_called_once()
+
+    def test_flush_pushes_partial_batch(self) -> None:
+        """Test that flush pushes a partially filled batch."""
+        streamer = LSLStreamer("test", sampling_rate=100.0)
+        mock_outlet = Mock()
+        streamer.outlet = mock_outlet
+        streamer._batch = np.empty((2, 2), dtype=np.float32)
+
+        streamer.push_sample_batched([1.0, 2.0])
+        streamer.flush()
+
+        mock_outlet.push_chunk.assert_called_once()